@@ -1,9 +1,10 @@
-import os
 from typing import Dict, Any
 
+from config import env
+
 
 def handle_get_config(request_data: Dict[str, Any] = None) -> Dict[str, Any]:
-    github_token = os.environ.get('GITHUB_API', '')
+    github_token = env.GITHUB_TOKEN
     return {
         'github_token': github_token
     }
@@ -1,6 +1,6 @@
-import os
 from typing import Dict, Any
 
+from config import env
 from services.github_api import (
     create_issue,
     get_repository_projects,
@@ -16,7 +16,7 @@ def handle_create_issue(request_data: Dict[str, Any]) -> Dict[str, Any]:
     labels = request_data.get('labels', [])
     assignees = request_data.get('assignees', [])
 
-    github_token = os.environ.get('GITHUB_API', '')
+    github_token = env.GITHUB_TOKEN
     result = create_issue(repo, title, body, labels, github_token, assignees)
     return result
 
@@ -24,7 +24,7 @@ def handle_create_issue(request_data: Dict[str, Any]) -> Dict[str, Any]:
 def handle_get_projects(request_data: Dict[str, Any]) -> Dict[str, Any]:
     repo = request_data.get('repo', '')
 
-    github_token = os.environ.get('GITHUB_API', '')
+    github_token = env.GITHUB_TOKEN
     result = get_repository_projects(repo, github_token)
     return result
 
@@ -32,7 +32,7 @@ def handle_get_projects(request_data: Dict[str, Any]) -> Dict[str, Any]:
 def handle_get_project_fields(request_data: Dict[str, Any]) -> Dict[str, Any]:
     project_id = request_data.get('project_id', '')
 
-    github_token = os.environ.get('GITHUB_API', '')
+    github_token = env.GITHUB_TOKEN
     result = get_project_fields(project_id, github_token)
     return result
 
@@ -46,7 +46,7 @@ def handle_create_issue_with_project(request_data: Dict[str, Any]) -> Dict[str,
     project_id = request_data.get('project_id', '')
     field_values = request_data.get('field_values', {})
 
-    github_token = os.environ.get('GITHUB_API', '')
+    github_token = env.GITHUB_TOKEN
 
     issue_result = create_issue(repo, title, body, labels, github_token, assignees)
 
@@ -61,7 +61,8 @@ def handle_create_issue_with_project(request_data: Dict[str, Any]) -> Dict[str,
             issue_number,
             project_id,
             field_values,
-            github_token
+            github_token,
+            issue_node_id=issue_result['issue_data'].get('node_id')
         )
 
         if not project_result['success']:
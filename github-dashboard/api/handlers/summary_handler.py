@@ -1,7 +1,7 @@
-import os
 from typing import Dict, Any, List
 
-from utils.cache import load_cache, save_cache
+from config import env
+from utils.cache import get_cached, set_cached
 from utils.text import extract_mentioned_users
 from services.github_api import fetch_pr_files
 from services.ai_service import get_summary
@@ -9,10 +9,11 @@ from services.ai_service import get_summary
 
 def handle_summarize(request_data: Dict[str, Any]) -> Dict[str, Any]:
     issue_id = str(request_data.get('id', ''))
-    cache = load_cache()
 
-    if issue_id and issue_id in cache:
-        return cache[issue_id]
+    if issue_id:
+        cached = get_cached(issue_id)
+        if cached is not None:
+            return cached
 
     issue_title = request_data.get('title', '')
     issue_body = request_data.get('body', '')
@@ -24,7 +25,7 @@ def handle_summarize(request_data: Dict[str, Any]) -> Dict[str, Any]:
     files: List[Dict[str, Any]] = []
 
     if is_pr and pr_url and repo_full_name:
-        github_token = os.environ.get('GITHUB_API', '')
+        github_token = env.GITHUB_TOKEN
         files = fetch_pr_files(pr_url, repo_full_name, github_token)
 
     summary = get_summary(issue_title, issue_body, files, is_pr)
@@ -36,7 +37,6 @@ def handle_summarize(request_data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
     if issue_id:
-        cache[issue_id] = response_data
-        save_cache(cache)
+        set_cached(issue_id, response_data)
 
     return response_data
@@ -11,6 +11,8 @@ from api.handlers.prioritize_handler import handle_prioritize
 from api.handlers.config_handler import handle_get_config
 
 
+API_PREFIX = '/api/'
+
 ROUTE_MAP = {
     '/api/config': handle_get_config,
     '/api/summarize': handle_summarize,
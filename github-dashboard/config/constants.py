@@ -1,5 +1,6 @@
 # API Configuration
 DEFAULT_PORT = 8080
+KEEP_ALIVE_TIMEOUT = 30  # seconds an idle browser connection may hold a server thread
 
 # GitHub API Limits
 MAX_PR_FILES = 10
@@ -7,6 +8,10 @@ MAX_PATCH_SIZE = 500
 MAX_FILE_CHANGES_DISPLAY = 500
 MAX_ISSUES_TO_PRIORITIZE = 15
 ISSUES_PER_PAGE = 30
+GITHUB_MAX_RETRIES = 3
+GITHUB_MAX_RETRY_WAIT = 60  # seconds
+GITHUB_MAX_IDLE_CONNECTIONS = 10  # per host
+GITHUB_MAX_REDIRECTS = 5
 
 # OpenAI Configuration
 SUMMARY_MAX_TOKENS = 300
@@ -14,6 +19,11 @@ ISSUE_MAX_TOKENS = 300
 PRIORITIZE_MAX_TOKENS = 300
 EXTRACT_DETAILS_MAX_TOKENS = 400
 CHAT_MAX_TOKENS = 5000
+OPENAI_MAX_WORKERS = 8
+OPENAI_CHAT_WORKERS = 8  # separate pool so chat turns never wait on batch work
 
 # Cache
-CACHE_FILE = '.summary_cache.json'
+CACHE_FILE = '.summary_cache.db'
+LEGACY_CACHE_FILE = '.summary_cache.json'  # imported into CACHE_FILE on first run
+ETAG_CACHE_MAX_AGE = 30 * 24 * 60 * 60  # seconds
+MEMORY_CACHE_SIZE = 512  # entries kept in memory per cache table
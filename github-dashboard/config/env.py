@@ -0,0 +1,16 @@
+"""Environment settings, read once at import instead of on every request."""
+import os
+
+
+GITHUB_TOKEN = ''
+OPENAI_API_KEY = ''
+
+
+def reload_env() -> None:
+    """Re-read settings from os.environ (e.g. after a token is rotated)."""
+    global GITHUB_TOKEN, OPENAI_API_KEY
+    GITHUB_TOKEN = os.environ.get('GITHUB_API', '')
+    OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY', '')
+
+
+reload_env()
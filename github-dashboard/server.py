@@ -1,5 +1,5 @@
 import http.server
-import socketserver
+import logging
 import webbrowser
 import os
 import sys
@@ -9,14 +9,19 @@ from typing import Dict, Any
 # Add current directory to path for package imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from api.routes import get_route_handler
+from api.routes import API_PREFIX, get_route_handler
 from utils.validation import validate_tokens
-from config.constants import DEFAULT_PORT
+from config.constants import DEFAULT_PORT, KEEP_ALIVE_TIMEOUT
 
 PORT = int(os.environ.get('PORT', DEFAULT_PORT))
 
 
 class GitHubAssistantHandler(http.server.SimpleHTTPRequestHandler):
+    # Keep connections open between requests; every response sets Content-Length
+    protocol_version = 'HTTP/1.1'
+    # Drop idle keep-alive connections instead of blocking a thread in readline forever
+    timeout = KEEP_ALIVE_TIMEOUT
+
     def end_headers(self) -> None:
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
@@ -25,20 +30,20 @@ class GitHubAssistantHandler(http.server.SimpleHTTPRequestHandler):
 
     def do_OPTIONS(self) -> None:
         self.send_response(200)
+        self.send_header('Content-Length', '0')
         self.end_headers()
 
     def do_GET(self) -> None:
-        # Check if this is an API route
-        if self.path.startswith('/api/'):
-            handler = get_route_handler(self.path)
-            if handler:
-                try:
-                    response_data = handler()
-                    self._send_json_response(response_data)
-                except Exception as e:
-                    self._send_error_response(str(e), 500)
-            else:
-                self._send_error_response(f"Route not found: {self.path}", 404)
+        # Every API route is in ROUTE_MAP, so one lookup tells API from static
+        handler = get_route_handler(self.path)
+        if handler:
+            try:
+                response_data = handler()
+                self._send_json_response(response_data)
+            except Exception as e:
+                self._send_error_response(str(e), 500)
+        elif self.path.startswith(API_PREFIX):
+            self._send_error_response(f"Route not found: {self.path}", 404)
         else:
             # Serve static files for non-API routes
             super().do_GET()
@@ -58,33 +63,39 @@ class GitHubAssistantHandler(http.server.SimpleHTTPRequestHandler):
     def _read_request_body(self) -> Dict[str, Any]:
         content_length = int(self.headers['Content-Length'])
         post_data = self.rfile.read(content_length)
-        return json.loads(post_data.decode('utf-8'))
+        return json.loads(post_data)
 
-    def _send_json_response(self, data: Dict[str, Any]) -> None:
-        self.send_response(200)
+    def _send_json_response(self, data: Dict[str, Any], status_code: int = 200) -> None:
+        payload = json.dumps(data, separators=(',', ':')).encode()
+        self.send_response(status_code)
         self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        if self.close_connection:
+            self.send_header('Connection', 'close')
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(payload)
 
     def _send_error_response(self, error_message: str, status_code: int = 500) -> None:
-        self.send_response(status_code)
-        self.send_header('Content-Type', 'application/json')
-        self.end_headers()
+        # The request body may not have been read, so don't reuse the connection
+        self.close_connection = True
         error_data = {
             'success': False,
             'error': error_message
         }
-        self.wfile.write(json.dumps(error_data).encode())
+        self._send_json_response(error_data, status_code)
 
     def log_message(self, format: str, *args) -> None:
         print(f"[{self.log_date_time_string()}] {format % args}")
 
 
 def run_server() -> None:
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(name)s: %(message)s')
     validate_tokens()
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-    with socketserver.TCPServer(("", PORT), GitHubAssistantHandler) as httpd:
+    # Each request runs on its own thread so a slow OpenAI/GitHub call
+    # doesn't hold up every other request from the dashboard.
+    with http.server.ThreadingHTTPServer(("", PORT), GitHubAssistantHandler) as httpd:
         print(f"Server running at http://localhost:{PORT}")
         webbrowser.open(f'http://localhost:{PORT}')
         try:
@@ -1,20 +1,65 @@
 import json
-import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from openai import OpenAI
 
 from utils.text import sanitize_chat_message, detect_structured_content_leakage, get_conversational_fallback
+from config import env
 from config.constants import (
     SUMMARY_MAX_TOKENS,
     ISSUE_MAX_TOKENS,
     PRIORITIZE_MAX_TOKENS,
     EXTRACT_DETAILS_MAX_TOKENS,
     CHAT_MAX_TOKENS,
-    MAX_ISSUES_TO_PRIORITIZE
+    MAX_ISSUES_TO_PRIORITIZE,
+    OPENAI_MAX_WORKERS,
+    OPENAI_CHAT_WORKERS
 )
 
-def llm_detect_readiness(text: str, api_key: str) -> bool:
+# Shared pool for OpenAI calls that can run side by side within one request
+_executor = ThreadPoolExecutor(max_workers=OPENAI_MAX_WORKERS)
+# Speculative chat calls get their own pool so a chat turn never queues
+# behind prioritize_issues batches
+_chat_executor = ThreadPoolExecutor(max_workers=OPENAI_CHAT_WORKERS)
+
+READY_KEYWORDS = [
+    "create the ticket",
+    "make the ticket",
+    "create the issue",
+    "make the issue",
+    "generate the ticket",
+    "generate the issue",
+    "i'm ready",
+    "im ready",
+    "ready to create",
+    "looks good",
+    "that's enough",
+    "thats enough",
+    "good enough",
+    "let's create",
+    "lets create"
+]
+
+# All keywords in one alternation so the text is scanned once per message
+_READY_RE = re.compile('|'.join(re.escape(k) for k in READY_KEYWORDS), re.IGNORECASE)
+
+
+def keyword_detect_readiness(text: str) -> bool:
+    """Cheap keyword check for an explicit request to create the issue."""
+    if not text:
+        return False
+
+    match = _READY_RE.search(text)
+    if match:
+        print(f"[READINESS_DETECTED] Keyword match: '{match.group(0).lower()}'")
+        return True
+    return False
+
+
+def _llm_readiness(text: str, api_key: str) -> bool:
     """
     Uses a very small LLM call to detect whether the user intends
     to create the GitHub issue now.
@@ -22,32 +67,6 @@ def llm_detect_readiness(text: str, api_key: str) -> bool:
     if not text or not text.strip():
         return False
 
-    # Quick keyword check first (fast path - catches 90% of cases)
-    ready_keywords = [
-        "create the ticket",
-        "make the ticket",
-        "create the issue",
-        "make the issue",
-        "generate the ticket",
-        "generate the issue",
-        "i'm ready",
-        "im ready",
-        "ready to create",
-        "looks good",
-        "that's enough",
-        "thats enough",
-        "good enough",
-        "let's create",
-        "lets create"
-    ]
-
-    text_lower = text.lower()
-    for keyword in ready_keywords:
-        if keyword in text_lower:
-            print(f"[READINESS_DETECTED] Keyword match: '{keyword}'")
-            return True
-
-    # If no keyword match, use LLM as fallback
     prompt = f"""Does the user want to create/finalize the GitHub issue NOW?
 
 User message: "{text}"
@@ -65,12 +84,14 @@ Answer ONLY: yes or no"""
             max_tokens=10,  # Increased from 5 for better detection
             api_key=api_key
         )
-        is_ready = response.strip().lower().startswith("yes")
+        answer = response.strip()
+        is_ready = answer.lower().startswith("yes")
         if is_ready:
-            print(f"[READINESS_DETECTED] LLM detected: {response.strip()}")
+            print(f"[READINESS_DETECTED] LLM detected: {answer}")
         return is_ready
     except Exception:
         # Fail open for common ready phrases
+        text_lower = text.lower()
         is_ready = any(phrase in text_lower for phrase in ["ready", "create", "make"])
         if is_ready:
             print(f"[READINESS_DETECTED] Fallback match")
@@ -78,9 +99,13 @@ Answer ONLY: yes or no"""
 
 
 
+PROMPTS_DIR = Path(__file__).parent.parent / 'prompts'
+
+
+@lru_cache(maxsize=None)
 def _load_prompt(name: str) -> str:
-    """Load a prompt template from the prompts directory."""
-    prompt_path = Path(__file__).parent.parent / 'prompts' / f'{name}.md'
+    """Load a prompt template from the prompts directory (read once per process)."""
+    prompt_path = PROMPTS_DIR / f'{name}.md'
     with open(prompt_path, 'r', encoding='utf-8') as f:
         return f.read()
 
@@ -91,10 +116,10 @@ def summarize_pull_request(
     files: List[Dict[str, Any]],
     api_key: str
 ) -> Dict[str, str]:
-    files_text = "\n".join([
+    files_text = "\n".join(
         f"- {f['filename']} ({f['status']}): +{f['additions']}/-{f['deletions']}"
         for f in files
-    ])
+    )
 
     prompt = _load_prompt('summarize_pr').format(
         title=title,
@@ -116,7 +141,7 @@ def get_summary(
     files: Optional[List[Dict[str, Any]]] = None,
     is_pr: bool = False
 ) -> Dict[str, str]:
-    api_key = os.environ.get('OPENAI_API_KEY', '')
+    api_key = env.OPENAI_API_KEY
 
     try:
         if is_pr and files:
@@ -130,13 +155,11 @@ def get_summary(
             return {"issue_type": "unknown", "summary": f"Summary unavailable: {str(e)}"}
 
 
-def prioritize_issues(issues: List[Dict[str, Any]]) -> List[int]:
-    api_key = os.environ.get('OPENAI_API_KEY', '')
-
-    issues_text = "\n".join([
+def _prioritize_batch(issues: List[Dict[str, Any]], api_key: str) -> List[int]:
+    issues_text = "\n".join(
         f"ID:{issue['id']} - {issue['title']}"
-        for issue in issues[:MAX_ISSUES_TO_PRIORITIZE]
-    ])
+        for issue in issues
+    )
 
     prompt = _load_prompt('prioritize_issues').format(issues_text=issues_text)
 
@@ -147,21 +170,56 @@ def prioritize_issues(issues: List[Dict[str, Any]]) -> List[int]:
         return [issue['id'] for issue in issues]
 
 
+def prioritize_issues(issues: List[Dict[str, Any]]) -> List[int]:
+    """
+    Rank issues by importance.
+
+    Lists longer than MAX_ISSUES_TO_PRIORITIZE are split into batches that are
+    ranked concurrently. The leaders of every batch then go through one final
+    ranking call, so at most MAX_ISSUES_TO_PRIORITIZE IDs come back and the
+    rest stay unranked, as they would for a single batch.
+    """
+    api_key = env.OPENAI_API_KEY
+
+    if len(issues) <= MAX_ISSUES_TO_PRIORITIZE:
+        return _prioritize_batch(issues, api_key)
+
+    batches = [
+        issues[i:i + MAX_ISSUES_TO_PRIORITIZE]
+        for i in range(0, len(issues), MAX_ISSUES_TO_PRIORITIZE)
+    ]
+    futures = [_executor.submit(_prioritize_batch, batch, api_key) for batch in batches]
+
+    # Rankings from different batches aren't comparable, so merge by ranking
+    # each batch's top picks against each other
+    issues_by_id = {issue['id']: issue for issue in issues}
+    per_batch = max(1, MAX_ISSUES_TO_PRIORITIZE // len(batches))
+    finalist_ids = dict.fromkeys(
+        issue_id
+        for future in futures
+        for issue_id in future.result()[:per_batch]
+        if issue_id in issues_by_id
+    )
+    if not finalist_ids:
+        return []
+    return _prioritize_batch([issues_by_id[issue_id] for issue_id in finalist_ids], api_key)
+
+
 def extract_issue_details_from_conversation(messages: List[Dict[str, str]]) -> Optional[Dict[str, Any]]:
     """
     Extract issue details from conversation history using AI.
     Used as fallback when AI doesn't explicitly update preview.
     """
-    api_key = os.environ.get('OPENAI_API_KEY', '')
+    api_key = env.OPENAI_API_KEY
 
     # Get last few messages for context - use more messages for better context
     recent_messages = messages[-10:] if len(messages) > 10 else messages
 
-    conversation_text = "\n".join([
+    conversation_text = "\n".join(
         f"{msg['role']}: {msg['content']}"
         for msg in recent_messages
         if msg.get('content')
-    ])
+    )
 
     prompt = _load_prompt('extract_issue_details').format(conversation_text=conversation_text)
 
@@ -181,11 +239,9 @@ def chat_issue_creation(
     user_message: str,
     current_preview_data: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
-    api_key = os.environ.get('OPENAI_API_KEY', '')
+    api_key = env.OPENAI_API_KEY
     system_prompt = _load_prompt('chat_issue_creation')
 
-    is_ready = llm_detect_readiness(user_message, api_key)
-
     tools = [
         {
             "type": "function",
@@ -247,14 +303,37 @@ def chat_issue_creation(
     messages.extend(conversation_history)
     messages.append({"role": "user", "content": user_message})
 
-    # 🔑 CRITICAL FIX: never force preview once user is ready
-    response = _call_openai_chat_with_tools(
-        messages,
-        tools,
-        max_tokens=CHAT_MAX_TOKENS,
-        api_key=api_key,
-        is_ready=is_ready
-    )
+    # Keyword matches are instant. Otherwise readiness needs its own short LLM
+    # call: start the usual update_preview call in the background and check
+    # readiness meanwhile. If the user is ready, the signal call starts at once
+    # and the speculative preview is abandoned - not waited on, but its tokens
+    # (up to CHAT_MAX_TOKENS) are still spent once it has started.
+    is_ready = keyword_detect_readiness(user_message)
+    preview_future = None
+    if not is_ready:
+        preview_future = _chat_executor.submit(
+            _call_openai_chat_with_tools,
+            messages,
+            tools,
+            max_tokens=CHAT_MAX_TOKENS,
+            api_key=api_key
+        )
+        is_ready = _llm_readiness(user_message, api_key)
+
+    if is_ready:
+        if preview_future is not None:
+            # Skips the call if it hasn't started yet
+            preview_future.cancel()
+        # 🔑 CRITICAL FIX: never force preview once user is ready
+        response = _call_openai_chat_with_tools(
+            messages,
+            tools,
+            max_tokens=CHAT_MAX_TOKENS,
+            api_key=api_key,
+            is_ready=True
+        )
+    else:
+        response = preview_future.result()
 
     # Initialize preview_data with current data if available (for merging)
     preview_data = current_preview_data.copy() if current_preview_data else {}
@@ -274,17 +353,11 @@ def chat_issue_creation(
 
             if func == "update_preview":
                 # 🔑 CRITICAL: Merge new data with existing data to preserve fields
-                # Only update fields that have meaningful values
-                for key, value in args.items():
-                    # Update if value is truthy OR if replacing None/empty with something
-                    if value or (value == [] and key not in preview_data):
-                        preview_data[key] = value
-                    # Keep existing value if new value is None/empty and we have existing data
-                    elif key not in preview_data:
-                        preview_data[key] = value
-
-                print(f"[PREVIEW_MERGE] Updated fields: {list(args.keys())}")
-                print(f"[PREVIEW_STATE] Current preview keys: {list(preview_data.keys())}")
+                # Meaningful values always win; empty ones only fill missing keys
+                preview_data.update({
+                    key: value for key, value in args.items()
+                    if value or key not in preview_data
+                })
 
     # --- PREVIEW FALLBACK (ONLY IF NOT READY) ---
     if not preview_data and not is_ready:
@@ -335,6 +408,12 @@ Respond conversationally only. No questions if the user appears finished.
     }
 
 
+@lru_cache(maxsize=4)
+def _openai_client(api_key: str) -> OpenAI:
+    """One client (and connection pool) per API key, reused across calls."""
+    return OpenAI(api_key=api_key)
+
+
 def _call_openai(prompt: str, max_tokens: int, api_key: str) -> Any:
     messages = [{"role": "user", "content": prompt}]
     content = _call_openai_chat(messages, max_tokens, api_key)
@@ -345,7 +424,7 @@ def _call_openai(prompt: str, max_tokens: int, api_key: str) -> Any:
 
 
 def _call_openai_chat(messages: List[Dict[str, str]], max_tokens: int, api_key: str) -> str:
-    client = OpenAI(api_key=api_key)
+    client = _openai_client(api_key)
     response = client.chat.completions.create(
         model="gpt-4o-mini",
         max_tokens=max_tokens,
@@ -361,7 +440,7 @@ def _call_openai_chat_with_tools(
     api_key: str,
     is_ready: bool = False
 ) -> Dict[str, Any]:
-    client = OpenAI(api_key=api_key)
+    client = _openai_client(api_key)
 
     # Determine tool_choice strategy
     if is_ready:
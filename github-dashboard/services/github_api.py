@@ -1,9 +1,242 @@
+import gzip
+import http.client
+import io
 import json
-import urllib.request
+import logging
+import threading
+import time
 import urllib.error
-from typing import Dict, List, Any
+import urllib.parse
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+
+from utils.cache import get_etag, get_etag_body, set_etag_entry
+from config.constants import (
+    MAX_PR_FILES,
+    MAX_PATCH_SIZE,
+    GITHUB_MAX_RETRIES,
+    GITHUB_MAX_RETRY_WAIT,
+    GITHUB_MAX_IDLE_CONNECTIONS,
+    GITHUB_MAX_REDIRECTS
+)
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'github-dashboard'
+
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+# Idle keep-alive connections per (scheme, host), shared by all request
+# threads so back-to-back calls to api.github.com skip the TCP/TLS handshake.
+_idle_connections: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+_pool_lock = threading.Lock()
+
+
+def _acquire_connection(
+    scheme: str,
+    host: str,
+    timeout: int,
+    fresh: bool = False
+) -> Tuple[http.client.HTTPConnection, bool]:
+    """Return (connection, reused) for host, reusing an idle one unless fresh is set."""
+    conn = None
+    if not fresh:
+        with _pool_lock:
+            idle = _idle_connections.get((scheme, host))
+            conn = idle.pop() if idle else None
+
+    if conn is None:
+        conn_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        return conn_class(host, timeout=timeout), False
+
+    conn.timeout = timeout
+    if conn.sock:
+        conn.sock.settimeout(timeout)
+    return conn, True
+
+
+def _release_connection(scheme: str, host: str, conn: http.client.HTTPConnection) -> None:
+    with _pool_lock:
+        idle = _idle_connections.setdefault((scheme, host), [])
+        if len(idle) < GITHUB_MAX_IDLE_CONNECTIONS:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _discard_idle_connections(scheme: str, host: str) -> None:
+    with _pool_lock:
+        idle = _idle_connections.pop((scheme, host), [])
+    for conn in idle:
+        conn.close()
+
+
+def _is_stale_connection_error(error: Exception, sending: bool) -> bool:
+    """Whether error shows a reused keep-alive connection was already closed by the server."""
+    if isinstance(error, (ConnectionResetError, BrokenPipeError)):
+        # Includes http.client.RemoteDisconnected (nothing came back)
+        return True
+    # A dead TLS socket can also fail the write with ssl.SSLError or another
+    # OSError; a timeout is not staleness, the server may be working on it
+    return sending and isinstance(error, OSError) and not isinstance(error, TimeoutError)
+
+
+def _send(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    body: Optional[bytes],
+    timeout: int
+) -> Tuple[int, http.client.HTTPMessage, bytes]:
+    """Send one request over a pooled connection and read the full, decoded response."""
+    parts = urllib.parse.urlsplit(url)
+    path = f'{parts.path}?{parts.query}' if parts.query else parts.path
+
+    conn, reused = _acquire_connection(parts.scheme, parts.netloc, timeout)
+    while True:
+        sending = True
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            sending = False
+            response = conn.getresponse()
+        except Exception as e:
+            conn.close()
+            if reused and _is_stale_connection_error(e, sending):
+                # The server dropped the idle connection before answering, so
+                # nothing was received. Its pooled siblings have idled at least
+                # as long; drop them and retry once on a brand-new connection.
+                _discard_idle_connections(parts.scheme, parts.netloc)
+                conn, reused = _acquire_connection(parts.scheme, parts.netloc, timeout, fresh=True)
+                continue
+            raise
+
+        try:
+            data = response.read()
+        except Exception:
+            # The server may already have acted on the request - never resend it
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            _release_connection(parts.scheme, parts.netloc, conn)
+
+        if data and response.headers.get('Content-Encoding') == 'gzip':
+            data = gzip.decompress(data)
+        return response.status, response.headers, data
+
+
+def _send_following_redirects(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    body: Optional[bytes],
+    timeout: int
+) -> Tuple[int, http.client.HTTPMessage, bytes]:
+    """_send, following GET redirects (renamed or transferred repos answer 301/307)."""
+    for _ in range(GITHUB_MAX_REDIRECTS + 1):
+        status, response_headers, data = _send(method, url, headers, body, timeout)
+        location = response_headers.get('Location')
+        if method != 'GET' or status not in _REDIRECT_STATUSES or not location:
+            return status, response_headers, data
+        url = urllib.parse.urljoin(url, location)
+
+    raise urllib.error.HTTPError(url, status, 'Too many redirects', response_headers, io.BytesIO(data))
+
+
+def _rate_limit_delay(status: int, headers: http.client.HTTPMessage, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying a rate-limited request, or None to give up."""
+    if status not in (403, 429):
+        return None
+
+    retry_after = headers.get('Retry-After')
+    if retry_after and retry_after.isdigit():
+        delay = float(retry_after)
+    elif headers.get('X-RateLimit-Remaining') == '0':
+        reset = headers.get('X-RateLimit-Reset', '')
+        delay = float(reset) - time.time() if reset.isdigit() else None
+    elif status == 429:
+        delay = float(2 ** attempt)
+    else:
+        # Plain 403 (bad token, missing scope) - not a rate limit
+        return None
+
+    if delay is None or delay > GITHUB_MAX_RETRY_WAIT:
+        return None
+    return max(delay, 1.0)
+
+
+def _github_request(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    body: Optional[bytes] = None,
+    timeout: int = 10
+) -> Tuple[int, http.client.HTTPMessage, bytes]:
+    """
+    Make a GitHub API request, backing off and retrying when rate limited.
+
+    headers are sent as given; build them with _auth_headers. Error statuses
+    (>= 400) are raised as urllib.error.HTTPError so callers can read the
+    response body from the exception.
+    """
+    for attempt in range(GITHUB_MAX_RETRIES + 1):
+        status, response_headers, data = _send_following_redirects(method, url, headers, body, timeout)
+        if status < 400:
+            return status, response_headers, data
+
+        delay = _rate_limit_delay(status, response_headers, attempt)
+        if delay is None or attempt == GITHUB_MAX_RETRIES:
+            reason = http.client.responses.get(status, '')
+            raise urllib.error.HTTPError(url, status, reason, response_headers, io.BytesIO(data))
+        logger.warning("GitHub rate limit hit, retrying in %.0fs", delay)
+        time.sleep(delay)
+
+
+@lru_cache(maxsize=4)
+def _auth_headers(token: str, scheme: str = 'token', json_body: bool = False) -> Dict[str, str]:
+    """
+    Complete request headers for a token, built once and shared by every call.
+
+    The returned dict is cached - copy it before adding request-specific headers.
+    """
+    headers = {
+        'Authorization': f'{scheme} {token}',
+        'User-Agent': USER_AGENT,
+        # JSON compresses several times over, so let GitHub gzip the response
+        'Accept-Encoding': 'gzip'
+    }
+    if json_body:
+        headers['Content-Type'] = 'application/json'
+    return headers
+
+
+def conditional_get(url: str, token: str, timeout: int = 10) -> Any:
+    """
+    GET a GitHub REST URL and return the decoded JSON.
+
+    The ETag of each response is stored alongside its body and sent back as
+    If-None-Match, so unchanged resources come back as an empty 304 (which
+    doesn't count against the rate limit) and are served from the cache.
+    """
+    headers = _auth_headers(token)
+    cached_etag = get_etag(url)
+    if cached_etag:
+        headers = {**headers, 'If-None-Match': cached_etag}
+
+    status, response_headers, data = _github_request('GET', url, headers, timeout=timeout)
+    if status == 304:
+        cached_body = get_etag_body(url)
+        if cached_body is not None:
+            return json.loads(cached_body)
+        # Entry vanished between the two reads; fetch it unconditionally
+        status, response_headers, data = _github_request('GET', url, _auth_headers(token), timeout=timeout)
 
-from config.constants import MAX_PR_FILES, MAX_PATCH_SIZE
+    etag = response_headers.get('ETag')
+    if etag:
+        set_etag_entry(url, etag, data)
+    return json.loads(data)
 
 
 def fetch_pr_files(pr_url: str, repo_full_name: str, github_token: str) -> List[Dict[str, Any]]:
@@ -11,119 +244,79 @@ def fetch_pr_files(pr_url: str, repo_full_name: str, github_token: str) -> List[
         # Extract PR number from URL or use pr_url as API endpoint
         if 'pull/' in pr_url:
             pr_number = pr_url.split('pull/')[-1].split('/')[0].split('#')[0]
-            api_url = f'https://api.github.com/repos/{repo_full_name}/pulls/{pr_number}/files'
+            # Only ask for the files we keep; full pages of patches can run to megabytes
+            api_url = f'https://api.github.com/repos/{repo_full_name}/pulls/{pr_number}/files?per_page={MAX_PR_FILES}'
         else:
             # Assume pr_url is already the API URL
             api_url = pr_url
 
-        req = urllib.request.Request(
-            api_url,
-            headers={'Authorization': f'token {github_token}'}
-        )
-
-        with urllib.request.urlopen(req, timeout=10) as response:
-            files_data = json.loads(response.read().decode('utf-8'))
-
-            # Extract relevant file information
-            files = []
-            for file in files_data[:MAX_PR_FILES]:
-                files.append({
-                    'filename': file.get('filename', ''),
-                    'status': file.get('status', ''),
-                    'additions': file.get('additions', 0),
-                    'deletions': file.get('deletions', 0),
-                    'changes': file.get('changes', 0),
-                    'patch': file.get('patch', '')[:MAX_PATCH_SIZE]
-                })
-            return files
+        files_data = conditional_get(api_url, github_token)
+
+        # Extract relevant file information
+        files = []
+        for file in files_data[:MAX_PR_FILES]:
+            files.append({
+                'filename': file.get('filename', ''),
+                'status': file.get('status', ''),
+                'additions': file.get('additions', 0),
+                'deletions': file.get('deletions', 0),
+                'changes': file.get('changes', 0),
+                'patch': file.get('patch', '')[:MAX_PATCH_SIZE]
+            })
+        return files
     except Exception as e:
-        print(f"Error fetching PR files: {e}")
+        logger.error("Error fetching PR files: %s", e)
         return []
 
 
 def fetch_my_activity(token: str) -> List[Dict[str, Any]]:
     try:
-        # First, get the authenticated user's username
-        print("\n" + "="*60)
-        print("FETCHING MY ACTIVITY")
-        print("="*60)
-
-        user_req = urllib.request.Request(
-            'https://api.github.com/user',
-            headers={'Authorization': f'token {token}'}
-        )
-        with urllib.request.urlopen(user_req, timeout=10) as response:
-            user_data = json.loads(response.read().decode('utf-8'))
-            username = user_data.get('login', '')
-            print(f"Authenticated user: {username}")
-
-        if not username:
-            print("ERROR: Could not get username")
-            return []
-
-        # Fetch user's issues (includes PRs)
-        # Use search API to get issues created by user
-        search_url = f'https://api.github.com/search/issues?q=author:{username}+is:open&per_page=100&sort=updated'
-        print(f"Search URL: {search_url}")
-
-        req = urllib.request.Request(
-            search_url,
-            headers={'Authorization': f'token {token}'}
-        )
+        # Open issues and PRs authored by the token's user; @me saves a GET /user
+        search_url = 'https://api.github.com/search/issues?q=author:@me+is:open&per_page=100&sort=updated'
+        search_data = conditional_get(search_url, token, timeout=15)
+        items = search_data.get('items', [])
+        total_count = search_data.get('total_count', 0)
+
+        # Add repository info to each item
+        for item in items:
+            if 'repository_url' in item:
+                owner, name = item['repository_url'].split('/')[-2:]
+                item['repository'] = {
+                    'name': name,
+                    'full_name': f"{owner}/{name}",
+                    'owner': {'login': owner}
+                }
 
-        with urllib.request.urlopen(req, timeout=15) as response:
-            search_data = json.loads(response.read().decode('utf-8'))
-            items = search_data.get('items', [])
-            total_count = search_data.get('total_count', 0)
-
-            print(f"\nTotal items found: {total_count}")
-            print(f"Items returned: {len(items)}")
-
-            if len(items) == 0:
-                print("\nNO ISSUES OR PRS FOUND!")
-                print("This could mean:")
-                print("  1. You have no open issues/PRs authored by you")
-                print("  2. Your GitHub token doesn't have 'repo' scope")
-                print("  3. The token is invalid or expired")
-                print("\nTo fix: Go to https://github.com/settings/tokens")
-                print("  - Create a new token with 'repo' scope")
-                print("  - Update your GITHUB_API environment variable")
-            else:
-                print("\n" + "-"*60)
-                print("ISSUES AND PRS:")
-                print("-"*60)
-
-            # Add repository info to each item
+        logger.info("My activity: %d items returned (%d found)", len(items), total_count)
+
+        if len(items) == 0:
+            logger.warning(
+                "No open issues or PRs found. This could mean:\n"
+                "  1. You have no open issues/PRs authored by you\n"
+                "  2. Your GitHub token doesn't have 'repo' scope\n"
+                "  3. The token is invalid or expired\n"
+                "To fix: Go to https://github.com/settings/tokens\n"
+                "  - Create a new token with 'repo' scope\n"
+                "  - Update your GITHUB_API environment variable"
+            )
+        elif logger.isEnabledFor(logging.DEBUG):
             for item in items:
-                is_pr = 'pull_request' in item
-                item_type = "PR" if is_pr else "Issue"
-
-                # Extract repo info from repository_url
-                if 'repository_url' in item:
-                    repo_url = item['repository_url']
-                    parts = repo_url.split('/')
-                    item['repository'] = {
-                        'name': parts[-1],
-                        'full_name': f"{parts[-2]}/{parts[-1]}",
-                        'owner': {'login': parts[-2]}
-                    }
-
-                    print(f"\n[{item_type}] {item['repository']['full_name']}#{item['number']}")
-                    print(f"  Title: {item['title']}")
-                    print(f"  URL: {item['html_url']}")
-
-            print("\n" + "="*60 + "\n")
-            return items
+                logger.debug(
+                    "[%s] %s#%d %s",
+                    "PR" if 'pull_request' in item else "Issue",
+                    item['repository']['full_name'],
+                    item['number'],
+                    item['title']
+                )
+
+        return items
 
     except urllib.error.HTTPError as e:
         error_body = e.read().decode('utf-8')
-        print(f"\nHTTP Error fetching my activity: {e.code}")
-        print(f"Error details: {error_body}")
+        logger.error("HTTP Error fetching my activity: %s\nError details: %s", e.code, error_body)
         return []
     except Exception as e:
-        print(f"\nError fetching my activity: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error fetching my activity: %s", e)
         return []
 
 
@@ -147,39 +340,33 @@ def create_issue(
         if assignees:
             issue_data['assignees'] = assignees
 
-        request_body = json.dumps(issue_data).encode('utf-8')
+        request_body = json.dumps(issue_data, separators=(',', ':')).encode('utf-8')
 
-        req = urllib.request.Request(
+        _, _, data = _github_request(
+            'POST',
             api_url,
-            data=request_body,
-            headers={
-                'Authorization': f'token {github_token}',
-                'Content-Type': 'application/json'
-            },
-            method='POST'
+            headers=_auth_headers(github_token, json_body=True),
+            body=request_body,
+            timeout=10
         )
 
-        with urllib.request.urlopen(req, timeout=10) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            return {
-                'success': True,
-                'issue_url': result.get('html_url', ''),
-                'issue_number': result.get('number', 0),
-                'issue_data': result
-            }
+        result = json.loads(data)
+        return {
+            'success': True,
+            'issue_url': result.get('html_url', ''),
+            'issue_number': result.get('number', 0),
+            'issue_data': result
+        }
 
     except urllib.error.HTTPError as e:
         error_body = e.read().decode('utf-8')
-        print(f"HTTP Error creating issue: {e.code}")
-        print(f"Error details: {error_body}")
+        logger.error("HTTP Error creating issue: %s\nError details: %s", e.code, error_body)
         return {
             'success': False,
             'error': f"HTTP {e.code}: {error_body}"
         }
     except Exception as e:
-        print(f"Error creating issue: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error creating issue: %s", e)
         return {
             'success': False,
             'error': str(e)
@@ -192,61 +379,65 @@ def execute_graphql_query(query: str, variables: Dict[str, Any], github_token: s
         request_body = json.dumps({
             'query': query,
             'variables': variables
-        }).encode('utf-8')
+        }, separators=(',', ':')).encode('utf-8')
 
-        req = urllib.request.Request(
+        _, _, data = _github_request(
+            'POST',
             'https://api.github.com/graphql',
-            data=request_body,
-            headers={
-                'Authorization': f'Bearer {github_token}',
-                'Content-Type': 'application/json'
-            },
-            method='POST'
+            headers=_auth_headers(github_token, 'Bearer', json_body=True),
+            body=request_body,
+            timeout=15
         )
 
-        with urllib.request.urlopen(req, timeout=15) as response:
-            result = json.loads(response.read().decode('utf-8'))
-
-            if 'errors' in result:
-                return {
-                    'success': False,
-                    'errors': result['errors']
-                }
+        result = json.loads(data)
 
+        if 'errors' in result:
             return {
-                'success': True,
-                'data': result.get('data', {})
+                'success': False,
+                'errors': result['errors']
             }
 
+        return {
+            'success': True,
+            'data': result.get('data', {})
+        }
+
     except Exception as e:
-        print(f"Error executing GraphQL query: {e}")
+        logger.error("Error executing GraphQL query: %s", e)
         return {
             'success': False,
             'error': str(e)
         }
 
 
-def get_repository_projects(repo_full_name: str, github_token: str) -> Dict[str, Any]:
-    """Get all Projects v2 for a repository"""
-    owner, repo = repo_full_name.split('/')
-
-    query = """
-    query ListRepositoryProjects($owner: String!, $repo: String!) {
-      repository(owner: $owner, name: $repo) {
-        projectsV2(first: 20, orderBy: {field: UPDATED_AT, direction: DESC}) {
-          nodes {
-            id
-            title
-            number
-            shortDescription
-          }
-        }
+PROJECTS_QUERY = """
+query ListRepositoryProjects($owner: String!, $repo: String!) {
+  repository(owner: $owner, name: $repo) {
+    projectsV2(first: 20, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes {
+        id
+        title
+        number
+        shortDescription
       }
     }
-    """
+  }
+}
+"""
+
+
+@lru_cache(maxsize=256)
+def _split_repo(repo_full_name: str) -> Tuple[str, str]:
+    owner, repo = repo_full_name.split('/')
+    return owner, repo
+
+
+def get_repository_projects(repo_full_name: str, github_token: str) -> Dict[str, Any]:
+    """Get all Projects v2 for a repository"""
+    owner, repo = _split_repo(repo_full_name)
 
     variables = {'owner': owner, 'repo': repo}
-    result = execute_graphql_query(query, variables, github_token)
+    result = execute_graphql_query(PROJECTS_QUERY, variables, github_token)
 
     if result['success']:
         projects = result['data'].get('repository', {}).get('projectsV2', {}).get('nodes', [])
@@ -258,50 +449,51 @@ def get_repository_projects(repo_full_name: str, github_token: str) -> Dict[str,
     return result
 
 
-def get_project_fields(project_id: str, github_token: str) -> Dict[str, Any]:
-    """Get all custom fields for a project"""
-    query = """
-    query GetProjectFields($projectId: ID!) {
-      node(id: $projectId) {
-        ... on ProjectV2 {
-          fields(first: 20) {
-            nodes {
-              ... on ProjectV2Field {
-                id
-                name
-                dataType
-              }
-              ... on ProjectV2SingleSelectField {
-                id
-                name
-                dataType
-                options {
-                  id
-                  name
-                }
-              }
-              ... on ProjectV2IterationField {
+PROJECT_FIELDS_QUERY = """
+query GetProjectFields($projectId: ID!) {
+  node(id: $projectId) {
+    ... on ProjectV2 {
+      fields(first: 20) {
+        nodes {
+          ... on ProjectV2Field {
+            id
+            name
+            dataType
+          }
+          ... on ProjectV2SingleSelectField {
+            id
+            name
+            dataType
+            options {
+              id
+              name
+            }
+          }
+          ... on ProjectV2IterationField {
+            id
+            name
+            dataType
+            configuration {
+              iterations {
                 id
-                name
-                dataType
-                configuration {
-                  iterations {
-                    id
-                    title
-                    startDate
-                    duration
-                  }
-                }
+                title
+                startDate
+                duration
               }
             }
           }
         }
       }
     }
-    """
+  }
+}
+"""
+
 
+def get_project_fields(project_id: str, github_token: str) -> Dict[str, Any]:
+    """Get all custom fields for a project"""
     variables = {'projectId': project_id}
-    result = execute_graphql_query(query, variables, github_token)
+    result = execute_graphql_query(PROJECT_FIELDS_QUERY, variables, github_token)
 
     if result['success']:
         fields = result['data'].get('node', {}).get('fields', {}).get('nodes', [])
@@ -317,17 +509,14 @@ def format_field_value(value: Any) -> Dict[str, Any]:
     """Format field value for GraphQL mutation"""
     if isinstance(value, str):
         # Check if it's a single select option ID (starts with specific prefix)
-        if value.startswith('PVTSSOO_') or value.startswith('PVTIO_'):
+        if value.startswith(('PVTSSOO_', 'PVTIO_')):
             return {'singleSelectOptionId': value}
         # Check if it's a date format (YYYY-MM-DD)
-        elif '-' in value and len(value) == 10:
-            try:
-                # Validate it's a date
-                parts = value.split('-')
-                if len(parts) == 3 and all(p.isdigit() for p in parts):
-                    return {'date': value}
-            except:
-                pass
+        elif (
+            len(value) == 10 and value[4] == '-' and value[7] == '-'
+            and value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit()
+        ):
+            return {'date': value}
         # Otherwise treat as text
         return {'text': value}
     elif isinstance(value, (int, float)):
@@ -336,24 +525,69 @@ def format_field_value(value: Any) -> Dict[str, Any]:
         return {'text': str(value)}
 
 
+@lru_cache(maxsize=32)
+def _build_field_updates_mutation(field_count: int) -> str:
+    """One mutation document with an aliased field update per field (u0, u1, ...)."""
+    variable_defs = ''.join(
+        f'\n          $field{i}: ID!\n          $value{i}: ProjectV2FieldValue!'
+        for i in range(field_count)
+    )
+    updates = ''.join(
+        f"""
+          u{i}: updateProjectV2ItemFieldValue(input: {{
+            projectId: $projectId
+            itemId: $itemId
+            fieldId: $field{i}
+            value: $value{i}
+          }}) {{
+            projectV2Item {{
+              id
+            }}
+          }}"""
+        for i in range(field_count)
+    )
+    return f"""
+        mutation UpdateProjectFields(
+          $projectId: ID!
+          $itemId: ID!{variable_defs}
+        ) {{{updates}
+        }}
+        """
+
+
+ADD_ITEM_MUTATION = """
+mutation AddIssueToProject($projectId: ID!, $contentId: ID!) {
+  addProjectV2ItemById(input: {
+    projectId: $projectId
+    contentId: $contentId
+  }) {
+    item {
+      id
+    }
+  }
+}
+"""
+
+
 def add_issue_to_project_with_fields(
     repo_full_name: str,
     issue_number: int,
     project_id: str,
     field_values: Dict[str, Any],
-    github_token: str
+    github_token: str,
+    issue_node_id: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Add an issue to a project and set custom field values"""
-    try:
-        # First, get the issue's node ID
-        api_url = f'https://api.github.com/repos/{repo_full_name}/issues/{issue_number}'
-        req = urllib.request.Request(
-            api_url,
-            headers={'Authorization': f'token {github_token}'}
-        )
+    """
+    Add an issue to a project and set custom field values.
 
-        with urllib.request.urlopen(req, timeout=10) as response:
-            issue_data = json.loads(response.read().decode('utf-8'))
+    Pass issue_node_id when it is already known (e.g. from create_issue) to
+    skip looking it up. All field values are set in a single request.
+    """
+    try:
+        if not issue_node_id:
+            # First, get the issue's node ID
+            api_url = f'https://api.github.com/repos/{repo_full_name}/issues/{issue_number}'
+            issue_data = conditional_get(api_url, github_token)
             issue_node_id = issue_data.get('node_id')
 
         if not issue_node_id:
@@ -363,21 +597,8 @@ def add_issue_to_project_with_fields(
             }
 
         # Add issue to project
-        add_mutation = """
-        mutation AddIssueToProject($projectId: ID!, $contentId: ID!) {
-          addProjectV2ItemById(input: {
-            projectId: $projectId
-            contentId: $contentId
-          }) {
-            item {
-              id
-            }
-          }
-        }
-        """
-
         add_result = execute_graphql_query(
-            add_mutation,
+            ADD_ITEM_MUTATION,
             {'projectId': project_id, 'contentId': issue_node_id},
             github_token
         )
@@ -388,43 +609,32 @@ def add_issue_to_project_with_fields(
         item_id = add_result['data']['addProjectV2ItemById']['item']['id']
 
         # Update field values
-        update_mutation = """
-        mutation UpdateProjectField(
-          $projectId: ID!
-          $itemId: ID!
-          $fieldId: ID!
-          $value: ProjectV2FieldValue!
-        ) {
-          updateProjectV2ItemFieldValue(input: {
-            projectId: $projectId
-            itemId: $itemId
-            fieldId: $fieldId
-            value: $value
-          }) {
-            projectV2Item {
-              id
-            }
-          }
-        }
-        """
-
-        for field_id, value in field_values.items():
-            # Format value based on field type
-            formatted_value = format_field_value(value)
+        if field_values:
+            field_ids = list(field_values)
+            variables = {'projectId': project_id, 'itemId': item_id}
+            for i, field_id in enumerate(field_ids):
+                variables[f'field{i}'] = field_id
+                # Format value based on field type
+                variables[f'value{i}'] = format_field_value(field_values[field_id])
 
             update_result = execute_graphql_query(
-                update_mutation,
-                {
-                    'projectId': project_id,
-                    'itemId': item_id,
-                    'fieldId': field_id,
-                    'value': formatted_value
-                },
+                _build_field_updates_mutation(len(field_ids)),
+                variables,
                 github_token
             )
 
             if not update_result['success']:
-                print(f"Warning: Failed to update field {field_id}: {update_result}")
+                # Each error's path starts with the alias (u0, u1, ...) of the failed update
+                failed = {
+                    error['path'][0]: error
+                    for error in update_result.get('errors', [])
+                    if error.get('path')
+                }
+                for i, field_id in enumerate(field_ids):
+                    if f'u{i}' in failed:
+                        logger.warning("Failed to update field %s: %s", field_id, failed[f'u{i}'])
+                if not failed:
+                    logger.warning("Failed to update fields %s: %s", field_ids, update_result)
 
         return {
             'success': True,
@@ -432,9 +642,7 @@ def add_issue_to_project_with_fields(
         }
 
     except Exception as e:
-        print(f"Error adding issue to project: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error adding issue to project: %s", e)
         return {
             'success': False,
             'error': str(e)
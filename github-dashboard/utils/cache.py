@@ -1,20 +1,160 @@
 import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Optional
 
-from config.constants import CACHE_FILE as CACHE_FILENAME
+from config.constants import (
+    CACHE_FILE as CACHE_FILENAME,
+    LEGACY_CACHE_FILE as LEGACY_CACHE_FILENAME,
+    ETAG_CACHE_MAX_AGE,
+    MEMORY_CACHE_SIZE
+)
 
 
 CACHE_FILE = Path(__file__).parent.parent / CACHE_FILENAME
+LEGACY_CACHE_FILE = Path(__file__).parent.parent / LEGACY_CACHE_FILENAME
 
+# SQLite in WAL mode: single-row reads and writes, safe across threads and
+# processes, no rewriting the whole cache on every new entry.
+_connection: Optional[sqlite3.Connection] = None
+_connection_lock = threading.Lock()
+_db_lock = threading.Lock()
 
-def load_cache() -> Dict[str, Any]:
-    if CACHE_FILE.exists():
-        with open(CACHE_FILE, 'r') as f:
-            return json.load(f)
-    return {}
 
+class _LRUCache:
+    """Small thread-safe LRU map kept in front of the database."""
 
-def save_cache(cache: Dict[str, Any]) -> None:
-    with open(CACHE_FILE, 'w') as f:
-        json.dump(cache, f)
+    def __init__(self, maxsize: int) -> None:
+        self._data: 'OrderedDict[str, Any]' = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+
+# Recently used summaries and ETags, so repeat lookups skip SQLite and JSON decoding
+_summary_memory = _LRUCache(MEMORY_CACHE_SIZE)
+_etag_memory = _LRUCache(MEMORY_CACHE_SIZE)
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(CACHE_FILE, isolation_level=None, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('CREATE TABLE IF NOT EXISTS cache (k TEXT PRIMARY KEY, v TEXT NOT NULL)')
+    _create_etags_table(conn)
+    _import_legacy_cache(conn)
+    return conn
+
+
+def _create_etags_table(conn: sqlite3.Connection) -> None:
+    columns = [row[1] for row in conn.execute('PRAGMA table_info(etags)')]
+    if columns and 'ts' not in columns:
+        # Table from before ts was tracked; it only holds cached responses
+        conn.execute('DROP TABLE etags')
+
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS etags ('
+        'url TEXT PRIMARY KEY, etag TEXT NOT NULL, body BLOB NOT NULL, ts INTEGER NOT NULL)'
+    )
+    # Entries nobody has re-stored in a while are unlikely to be requested again
+    conn.execute('DELETE FROM etags WHERE ts < ?', (int(time.time()) - ETAG_CACHE_MAX_AGE,))
+
+
+def _import_legacy_cache(conn: sqlite3.Connection) -> None:
+    """Carry entries over from the old JSON cache file into an empty database."""
+    if not LEGACY_CACHE_FILE.exists():
+        return
+    if conn.execute('SELECT 1 FROM cache LIMIT 1').fetchone():
+        return
+
+    with open(LEGACY_CACHE_FILE, 'r') as f:
+        legacy = json.load(f)
+
+    conn.execute('BEGIN')
+    conn.executemany(
+        'INSERT OR IGNORE INTO cache (k, v) VALUES (?, ?)',
+        ((key, json.dumps(value)) for key, value in legacy.items())
+    )
+    conn.execute('COMMIT')
+
+
+def _get_connection() -> sqlite3.Connection:
+    global _connection
+    if _connection is None:
+        with _connection_lock:
+            if _connection is None:
+                _connection = _connect()
+    return _connection
+
+
+def get_cached(key: str) -> Optional[Any]:
+    value = _summary_memory.get(key)
+    if value is not None:
+        return value
+
+    conn = _get_connection()
+    with _db_lock:
+        row = conn.execute('SELECT v FROM cache WHERE k = ?', (key,)).fetchone()
+    if not row:
+        return None
+
+    value = json.loads(row[0])
+    _summary_memory.put(key, value)
+    return value
+
+
+def set_cached(key: str, value: Any) -> None:
+    conn = _get_connection()
+    payload = json.dumps(value)
+    with _db_lock:
+        conn.execute('INSERT OR REPLACE INTO cache (k, v) VALUES (?, ?)', (key, payload))
+    _summary_memory.put(key, value)
+
+
+def get_etag(url: str) -> Optional[str]:
+    """Return the ETag last stored for a GitHub URL, without loading its body."""
+    etag = _etag_memory.get(url)
+    if etag is not None:
+        return etag
+
+    conn = _get_connection()
+    with _db_lock:
+        row = conn.execute('SELECT etag FROM etags WHERE url = ?', (url,)).fetchone()
+    if not row:
+        return None
+
+    _etag_memory.put(url, row[0])
+    return row[0]
+
+
+def get_etag_body(url: str) -> Optional[bytes]:
+    conn = _get_connection()
+    with _db_lock:
+        row = conn.execute('SELECT body FROM etags WHERE url = ?', (url,)).fetchone()
+    return row[0] if row else None
+
+
+def set_etag_entry(url: str, etag: str, body: bytes) -> None:
+    conn = _get_connection()
+    with _db_lock:
+        conn.execute(
+            'INSERT OR REPLACE INTO etags (url, etag, body, ts) VALUES (?, ?, ?, ?)',
+            (url, etag, body, int(time.time()))
+        )
+    _etag_memory.put(url, etag)
@@ -2,9 +2,33 @@ import re
 from typing import List, Optional, Dict
 
 
+_CODE_BLOCK_RE = re.compile(r'```(?:html)?\s*(.*?)\s*```', re.DOTALL)
+_MENTION_RE = re.compile(r'@([a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38})')
+
+# "Field Name: Value" patterns common in structured data, combined into one
+# alternation so the message is scanned once instead of once per field
+_STRUCTURED_FIELDS_RE = re.compile(
+    '|'.join([
+        r'Issue\s+Type\s*:\s*[^\n]+',
+        r'Title\s*:\s*[^\n]+',
+        r'Description\s*:\s*[^\n]+',
+        r'Requirements\s*:\s*',
+        r'Priority\s*:\s*[^\n]+',
+        r'Labels\s*:\s*[^\n]+',
+    ]),
+    re.IGNORECASE
+)
+_BULLET_LIST_RE = re.compile(r'(?:^|\n)[\s]*[-*•]\s+[^\n]+(?:\n[\s]*[-*•]\s+[^\n]+){2,}', re.MULTILINE)
+_FIELD_HEADER_RE = re.compile(r'#{1,3}\s*(Issue Type|Title|Description|Requirements|Priority)\s*\n', re.IGNORECASE)
+_EXCESS_NEWLINES_RE = re.compile(r'\n\s*\n\s*\n+')
+_LEAKAGE_INDICATORS_RE = re.compile(
+    r'(Issue\s+Type\s*:)|(Title\s*:)|(Description\s*:)|(Requirements\s*:)|(Priority\s*:)',
+    re.IGNORECASE
+)
+
+
 def strip_markdown_code_blocks(text: str) -> str:
-    pattern = r'```(?:html)?\s*(.*?)\s*```'
-    match = re.search(pattern, text, re.DOTALL)
+    match = _CODE_BLOCK_RE.search(text)
     if match:
         return match.group(1).strip()
     return text.strip()
@@ -14,15 +38,8 @@ def extract_mentioned_users(text: Optional[str]) -> List[str]:
     if not text:
         return []
 
-    mentions = re.findall(r'@([a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38})', text)
-
-    seen = set()
-    unique_mentions = []
-    for mention in mentions:
-        if mention not in seen:
-            seen.add(mention)
-            unique_mentions.append(mention)
-    return unique_mentions
+    # dict.fromkeys drops duplicates while keeping first-seen order
+    return list(dict.fromkeys(_MENTION_RE.findall(text)))
 
 
 def sanitize_chat_message(message: str, preview_data: Optional[Dict] = None) -> Optional[str]:
@@ -45,22 +62,11 @@ def sanitize_chat_message(message: str, preview_data: Optional[Dict] = None) ->
     original_message = message
 
     # Pattern 1: Remove structured field patterns (e.g., "Issue Type: Feature Request")
-    # Matches: "Field Name: Value" patterns common in structured data
-    structured_fields = [
-        r'Issue\s+Type\s*:\s*[^\n]+',
-        r'Title\s*:\s*[^\n]+',
-        r'Description\s*:\s*[^\n]+',
-        r'Requirements\s*:\s*',
-        r'Priority\s*:\s*[^\n]+',
-        r'Labels\s*:\s*[^\n]+',
-    ]
-
-    for pattern in structured_fields:
-        message = re.sub(pattern, '', message, flags=re.IGNORECASE)
+    message = _STRUCTURED_FIELDS_RE.sub('', message)
 
     # Pattern 2: Remove bullet point sections that look like structured data
     # Matches multi-line bulleted lists that typically come from preview content
-    message = re.sub(r'(?:^|\n)[\s]*[-*•]\s+[^\n]+(?:\n[\s]*[-*•]\s+[^\n]+){2,}', '', message, flags=re.MULTILINE)
+    message = _BULLET_LIST_RE.sub('', message)
 
     # Pattern 3: If preview_data exists, remove any exact matches of preview content
     if preview_data:
@@ -72,18 +78,17 @@ def sanitize_chat_message(message: str, preview_data: Optional[Dict] = None) ->
         if preview_data.get('body'):
             # Remove large chunks of the body if they appear (first 200 chars as detection)
             body_preview = preview_data['body'][:200]
-            if body_preview in message:
+            idx = message.rfind(body_preview)
+            if idx != -1:
                 # This indicates major content leakage - remove everything before conversational part
-                parts = message.split(body_preview)
-                if len(parts) > 1:
-                    # Keep only the last part which should be conversational
-                    message = parts[-1]
+                # Keep only what follows the last occurrence, which should be conversational
+                message = message[idx + len(body_preview):]
 
     # Pattern 4: Remove markdown headers that look like field names
-    message = re.sub(r'#{1,3}\s*(Issue Type|Title|Description|Requirements|Priority)\s*\n', '', message, flags=re.IGNORECASE)
+    message = _FIELD_HEADER_RE.sub('', message)
 
     # Clean up excessive whitespace/newlines left by removals
-    message = re.sub(r'\n\s*\n\s*\n+', '\n\n', message)
+    message = _EXCESS_NEWLINES_RE.sub('\n\n', message)
     message = message.strip()
 
     # If we've removed too much (>80% of content), the message was mostly structured data
@@ -103,22 +108,15 @@ def detect_structured_content_leakage(message: str) -> bool:
     if not message:
         return False
 
-    # Count how many structured field indicators appear
-    structured_indicators = [
-        r'Issue\s+Type\s*:',
-        r'Title\s*:',
-        r'Description\s*:',
-        r'Requirements\s*:',
-        r'Priority\s*:',
-    ]
-
-    matches = 0
-    for pattern in structured_indicators:
-        if re.search(pattern, message, re.IGNORECASE):
-            matches += 1
-
-    # If 2+ structured fields appear, it's likely leaked content
-    return matches >= 2
+    # Count how many different structured field indicators appear (each
+    # capture group is one field), stopping as soon as a second one shows up
+    seen_fields = set()
+    for match in _LEAKAGE_INDICATORS_RE.finditer(message):
+        seen_fields.add(match.lastindex)
+        # If 2+ structured fields appear, it's likely leaked content
+        if len(seen_fields) >= 2:
+            return True
+    return False
 
 
 def get_conversational_fallback(preview_data: Optional[Dict] = None) -> str:
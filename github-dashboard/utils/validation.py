@@ -1,8 +1,8 @@
-import os
+from config import env
 
 
 def validate_tokens() -> None:
-    if not os.environ.get('GITHUB_API', '').strip():
+    if not env.GITHUB_TOKEN.strip():
         raise ValueError("No GITHUB_API token found")
-    if not os.environ.get('OPENAI_API_KEY', '').strip():
+    if not env.OPENAI_API_KEY.strip():
         raise ValueError("No OPENAI_API_KEY found")